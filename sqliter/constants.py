@@ -43,3 +43,8 @@ SQLITE_TYPE_MAPPING = {
     set: "BLOB",
     tuple: "BLOB",
 }
+
+# The number of prepared statements each SQLite connection keeps cached. The
+# sqlite3 default is 128; the SQL generated for a model only depends on its
+# fields and query shape, so a larger cache lets repeated queries skip parsing.
+STATEMENT_CACHE_SIZE = 256
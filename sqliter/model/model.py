@@ -12,8 +12,13 @@ from __future__ import annotations
 import datetime
 import pickle
 import re
+import types
+from functools import lru_cache
+from importlib.util import find_spec
 from typing import (
+    Annotated,
     Any,
+    Callable,
     ClassVar,
     Optional,
     Protocol,
@@ -24,13 +29,134 @@ from typing import (
     get_origin,
 )
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    PlainValidator,
+    TypeAdapter,
+    ValidationError,
+    WrapValidator,
+)
 
 from sqliter.helpers import from_unix_timestamp, to_unix_timestamp
 
 T = TypeVar("T", bound="BaseDBModel")
 
 
+# Whether the optional 'inflect' package is installed. This only looks up the
+# module spec, so 'inflect' itself is not imported until it is first needed.
+_HAS_INFLECT = find_spec("inflect") is not None
+
+
+@lru_cache(maxsize=1)
+def _get_inflect_engine() -> Optional[Any]:  # noqa: ANN401
+    """Return a shared 'inflect' engine, or None if it is not installed.
+
+    The import is only done on the first call, and the engine (or the lack of
+    one) is cached so later calls skip the import machinery.
+
+    Returns:
+        An 'inflect.engine' instance if 'inflect' is available, else None.
+    """
+    if not _HAS_INFLECT:
+        return None
+
+    import inflect  # noqa: PLC0415
+
+    return inflect.engine()
+
+
+# The origins of both 'Optional[X]'/'Union[X, Y]' and PEP 604 'X | Y'
+# annotations. 'types.UnionType' only exists from Python 3.10.
+_UNION_ORIGINS = frozenset({Union, getattr(types, "UnionType", Union)})
+
+# Types whose constructor gives the same result as Pydantic's lax parsing for
+# the values SQLite returns, so they can be converted without an adapter.
+_DIRECT_TYPES = (str, int, float)
+
+# Pydantic validators that can be attached to a field through 'Annotated'.
+_FUNCTIONAL_VALIDATORS = (
+    AfterValidator,
+    BeforeValidator,
+    PlainValidator,
+    WrapValidator,
+)
+
+
+def _has_custom_validation(annotation: Any) -> bool:  # noqa: ANN401
+    """Check if an annotation (or its metadata) carries its own validation.
+
+    Args:
+        annotation: A field annotation, a type argument or a metadata object.
+
+    Returns:
+        True if the annotation, or anything nested inside it, is a functional
+        validator or defines its own Pydantic core schema.
+    """
+    if isinstance(annotation, _FUNCTIONAL_VALIDATORS) or hasattr(
+        annotation, "__get_pydantic_core_schema__"
+    ):
+        return True
+    return any(_has_custom_validation(arg) for arg in get_args(annotation))
+
+
+def _make_partial_converter(
+    field_type: Optional[type],
+    metadata: tuple[Any, ...] = (),
+) -> Callable[[Any], Any]:
+    """Build a converter that coerces a raw value to a field's type.
+
+    Args:
+        field_type: The annotated type of the field.
+        metadata: The field's 'Annotated' metadata, such as constraints.
+
+    Returns:
+        A callable taking a (non-None) value and returning it converted.
+        Strings for 'str', 'int' and 'float' fields (and Unions of them) are
+        converted by calling the type. Anything else is parsed by a Pydantic
+        'TypeAdapter' in lax mode, which raises a 'ValidationError' if the
+        value does not fit the field.
+    """
+    origin = get_origin(field_type)
+    members = (
+        get_args(field_type) if origin in _UNION_ORIGINS else (field_type,)
+    )
+    candidates = tuple(arg for arg in members if arg is not type(None))
+    direct = not metadata and all(arg in _DIRECT_TYPES for arg in candidates)
+    # Values that already have one of these exact types need no conversion
+    exact = (
+        frozenset(candidates)
+        if not metadata and all(isinstance(arg, type) for arg in candidates)
+        else frozenset()
+    )
+    adapter: Optional[TypeAdapter[Any]] = None
+
+    def convert(value: Any) -> Any:  # noqa: ANN401
+        nonlocal adapter
+        if type(value) in exact:
+            return value
+        if direct and type(value) is str:
+            for candidate in candidates:
+                try:
+                    return candidate(value)
+                except ValueError:  # noqa: PERF203
+                    pass
+        # Pydantic handles everything else, for example '0' in a TEXT column
+        # for an 'Optional[bool]' or a 'Literal', and rejects invalid values.
+        # The adapter is only built when needed.
+        if adapter is None:
+            params = (field_type, *metadata)
+            adapter = TypeAdapter(
+                cast("Any", Annotated)[params] if metadata else field_type
+            )
+        return adapter.validate_python(value)
+
+    return convert
+
+
 class SerializableField(Protocol):
     """Protocol for fields that can be serialized or deserialized."""
 
@@ -56,11 +182,20 @@ class BaseDBModel(BaseModel):
         description="Unix timestamp when the record was last updated.",
     )
 
+    _table_name: ClassVar[Optional[str]] = None
+    _partial_converters: ClassVar[Optional[dict[str, Callable[[Any], Any]]]] = (
+        None
+    )
+    _custom_validators: ClassVar[Optional[bool]] = None
+    _field_names: ClassVar[Optional[frozenset[str]]] = None
+    _select_columns: ClassVar[Optional[str]] = None
+
     model_config = ConfigDict(
         extra="ignore",
         populate_by_name=True,
         validate_assignment=True,
         from_attributes=True,
+        defer_build=True,
     )
 
     class Meta:
@@ -99,42 +234,190 @@ class BaseDBModel(BaseModel):
         Returns:
             An instance of the model class with the provided data.
         """
+        converted_obj = cls._convert_values(obj, strict=False)
+        return cast(T, cls.model_construct(**converted_obj))
+
+    @classmethod
+    def model_validate_row(cls: type[T], obj: dict[str, Any]) -> T:
+        """Create a model instance from a full row read from the database.
+
+        Stored rows were validated on the way in, so Pydantic validation is
+        skipped and the values are only coerced to the field types. Models
+        with their own validators, and rows with a value that does not fit
+        its field, are fully validated instead.
+
+        Args:
+            obj: A dictionary of every field name and its deserialized value.
+
+        Returns:
+            An instance of the model class with the provided data.
+
+        Raises:
+            ValidationError: If the row does not validate against the model.
+        """
+        if cls.has_custom_validators():
+            return cls(**obj)
+        try:
+            converted_obj = cls._convert_values(obj, strict=True)
+        except ValidationError:
+            # Let Pydantic report every invalid value in the row
+            return cls(**obj)
+        return cast(T, cls.model_construct(**converted_obj))
+
+    @classmethod
+    def _convert_values(
+        cls, obj: dict[str, Any], *, strict: bool
+    ) -> dict[str, Any]:
+        """Convert raw values to their field types with the cached converters.
+
+        Args:
+            obj: A dictionary of field names and values.
+            strict: If False, a value that no member of a Union field accepts
+                is kept unchanged rather than raising.
+
+        Returns:
+            A dictionary of the field names and converted values.
+
+        Raises:
+            ValidationError: If a value does not fit its field.
+        """
+        converters = cls._get_partial_converters()
         converted_obj: dict[str, Any] = {}
         for field_name, value in obj.items():
-            field = cls.model_fields[field_name]
-            field_type: Optional[type] = field.annotation
-            if (
-                field_type is None or value is None
-            ):  # Direct check for None values here
+            # Direct check for None values here
+            if value is None:
                 converted_obj[field_name] = None
-            else:
-                origin = get_origin(field_type)
-                if origin is Union:
-                    args = get_args(field_type)
-                    for arg in args:
-                        try:
-                            # Try converting the value to the type
-                            converted_obj[field_name] = arg(value)
-                            break
-                        except (ValueError, TypeError):
-                            pass
-                    else:
-                        converted_obj[field_name] = value
-                else:
-                    converted_obj[field_name] = field_type(value)
+                continue
+            try:
+                converted_obj[field_name] = converters[field_name](value)
+            except ValidationError:
+                annotation = cls.model_fields[field_name].annotation
+                if strict or get_origin(annotation) not in _UNION_ORIGINS:
+                    raise
+                converted_obj[field_name] = value
+        return converted_obj
 
-        return cast(T, cls.model_construct(**converted_obj))
+    @classmethod
+    def has_custom_validators(cls) -> bool:
+        """Check if the model defines any custom Pydantic validators.
+
+        The result is worked out the first time it is needed and then cached
+        on the class.
+
+        Returns:
+            True if the model has field, model or legacy validators, or a field
+            with validators in its 'Annotated' metadata or a type that defines
+            its own Pydantic core schema.
+        """
+        custom: Optional[bool] = cls.__dict__.get("_custom_validators")
+        if custom is None:
+            decorators = cls.__pydantic_decorators__
+            custom = bool(
+                decorators.field_validators
+                or decorators.model_validators
+                or decorators.validators
+                or decorators.root_validators
+            ) or any(
+                _has_custom_validation(field.annotation)
+                or any(map(_has_custom_validation, field.metadata))
+                for field in cls.model_fields.values()
+            )
+            cls._custom_validators = custom
+        return custom
+
+    @classmethod
+    def _get_partial_converters(cls) -> dict[str, Callable[[Any], Any]]:
+        """Get the per-field value converters used for partial validation.
+
+        The converters are built from the field annotations the first time
+        they are needed and then cached on the class, so the annotations are
+        not re-inspected for every row.
+
+        Returns:
+            A dictionary mapping each field name to its converter.
+        """
+        converters: Optional[dict[str, Callable[[Any], Any]]] = (
+            cls.__dict__.get("_partial_converters")
+        )
+        if converters is None:
+            converters = {
+                field_name: _make_partial_converter(
+                    field.annotation, tuple(field.metadata)
+                )
+                for field_name, field in cls.model_fields.items()
+            }
+            cls._partial_converters = converters
+        return converters
+
+    @classmethod
+    def _get_field_names(cls) -> frozenset[str]:
+        """Get the names of the model's fields, used to validate queries.
+
+        The names are worked out the first time they are needed and then
+        cached on the class.
+
+        Returns:
+            A frozenset of the field names defined on the model.
+        """
+        field_names: Optional[frozenset[str]] = cls.__dict__.get("_field_names")
+        if field_names is None:
+            field_names = frozenset(cls.model_fields)
+            cls._field_names = field_names
+        return field_names
+
+    @classmethod
+    def _get_select_columns(cls) -> str:
+        """Get the quoted column list used to SELECT every field of the model.
+
+        The list is built the first time it is needed and then cached on the
+        class.
+
+        Returns:
+            A comma-separated string of every quoted field name of the model.
+        """
+        columns: Optional[str] = cls.__dict__.get("_select_columns")
+        if columns is None:
+            columns = ", ".join(f'"{field}"' for field in cls.model_fields)
+            cls._select_columns = columns
+        return columns
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        """Compute and cache the table name when a model class is created.
+
+        The table name only depends on the class name and its Meta
+        configuration, so it is worked out once here rather than on every
+        call to 'get_table_name'.
+
+        Args:
+            **kwargs: Keyword arguments passed on to the parent class.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._table_name = cls._derive_table_name()
 
     @classmethod
     def get_table_name(cls) -> str:
         """Get the database table name for the model.
 
         This method determines the table name based on the Meta configuration
-        or derives it from the class name if not explicitly set.
+        or derives it from the class name if not explicitly set. The result is
+        cached on the class when it is created.
 
         Returns:
             The name of the database table for this model.
         """
+        table_name: str | None = cls.__dict__.get("_table_name")
+        if table_name is None:
+            table_name = cls._derive_table_name()
+        return table_name
+
+    @classmethod
+    def _derive_table_name(cls) -> str:
+        """Derive the database table name for the model.
+
+        Returns:
+            The table name from the Meta class if set, otherwise the class
+            name converted to snake_case and pluralized.
+        """
         table_name: str | None = getattr(cls.Meta, "table_name", None)
         if table_name is not None:
             return table_name
@@ -146,18 +429,16 @@ class BaseDBModel(BaseModel):
         snake_case_name = re.sub(r"(?<!^)(?=[A-Z])", "_", class_name).lower()
 
         # Pluralize the table name
-        try:
-            import inflect
-
-            p = inflect.engine()
-            return p.plural(snake_case_name)
-        except ImportError:
-            # Fallback to simple pluralization by adding 's'
-            return (
-                snake_case_name
-                if snake_case_name.endswith("s")
-                else snake_case_name + "s"
-            )
+        inflect_engine = _get_inflect_engine()
+        if inflect_engine is not None:
+            return cast("str", inflect_engine.plural(snake_case_name))
+
+        # Fallback to simple pluralization by adding 's'
+        return (
+            snake_case_name
+            if snake_case_name.endswith("s")
+            else snake_case_name + "s"
+        )
 
     @classmethod
     def get_primary_key(cls) -> str:
@@ -95,11 +95,11 @@ class QueryBuilder:
         """
         if self._fields is None:
             return
-        valid_fields = set(self.model_class.model_fields.keys())
+        valid_fields = self.model_class._get_field_names()  # noqa: SLF001
         invalid_fields = set(self._fields) - valid_fields
         if invalid_fields:
             err_message = (
-                f"Invalid fields specified: {', '.join(invalid_fields)}"
+                f"Invalid fields specified: {', '.join(sorted(invalid_fields))}"
             )
             raise ValueError(err_message)
 
@@ -173,14 +173,14 @@ class QueryBuilder:
             if "pk" in fields:
                 err = "The primary key 'pk' cannot be excluded."
                 raise ValueError(err)
-            all_fields = set(self.model_class.model_fields.keys())
+            all_fields = self.model_class._get_field_names()  # noqa: SLF001
 
             # Check for invalid fields before subtraction
             invalid_fields = set(fields) - all_fields
             if invalid_fields:
                 err = (
                     "Invalid fields specified for exclusion: "
-                    f"{', '.join(invalid_fields)}"
+                    f"{', '.join(sorted(invalid_fields))}"
                 )
                 raise ValueError(err)
 
@@ -209,10 +209,8 @@ class QueryBuilder:
         Raises:
             ValueError: If the specified field is invalid.
         """
-        all_fields = set(self.model_class.model_fields.keys())
-
         # Validate that the field exists
-        if field not in all_fields:
+        if field not in self.model_class._get_field_names():  # noqa: SLF001
             err = f"Invalid field specified: {field}"
             raise ValueError(err)
 
@@ -513,17 +511,35 @@ class QueryBuilder:
         self._order_by = f'"{order_by_field}" {sort_order}'
         return self
 
+    def _get_select_fields(self) -> str:
+        """Build the column list for a SELECT query.
+
+        Returns:
+            A comma-separated string of quoted column names. This is the
+            selected fields (always including 'pk') if any were specified,
+            otherwise all fields of the model.
+        """
+        if self._fields:
+            if "pk" not in self._fields:
+                self._fields.append("pk")
+            return ", ".join(f'"{field}"' for field in self._fields)
+
+        return self.model_class._get_select_columns()  # noqa: SLF001
+
     def _execute_query(
         self,
         *,
         fetch_one: bool = False,
         count_only: bool = False,
+        exists_only: bool = False,
     ) -> list[tuple[Any, ...]] | Optional[tuple[Any, ...]]:
         """Execute the constructed SQL query.
 
         Args:
             fetch_one: If True, fetch only one result.
             count_only: If True, return only the count of results.
+            exists_only: If True, select a constant for at most one matching
+                row, so SQLite can stop at the first match.
 
         Returns:
             A list of tuples (all results), a single tuple (one result),
@@ -532,16 +548,15 @@ class QueryBuilder:
         Raises:
             RecordFetchError: If there's an error executing the query.
         """
-        if count_only:
+        # With a limit or offset the rows in that window are counted, so they
+        # are selected in a subquery and counted below.
+        windowed_count = count_only and self._limit is not None
+        if count_only and not windowed_count:
             fields = "COUNT(*)"
-        elif self._fields:
-            if "pk" not in self._fields:
-                self._fields.append("pk")
-            fields = ", ".join(f'"{field}"' for field in self._fields)
+        elif exists_only or windowed_count:
+            fields = "1"
         else:
-            fields = ", ".join(
-                f'"{field}"' for field in self.model_class.model_fields
-            )
+            fields = self._get_select_fields()
 
         sql = f'SELECT {fields} FROM "{self.table_name}"'  # noqa: S608 # nosec
 
@@ -551,16 +566,19 @@ class QueryBuilder:
         if self.filters:
             sql += f" WHERE {where_clause}"
 
-        if self._order_by:
+        # Ordering can't change whether a row exists or how many rows there
+        # are, so skip it in those cases
+        if self._order_by and not (exists_only or count_only):
             sql += f" ORDER BY {self._order_by}"
 
-        if self._limit is not None:
-            sql += " LIMIT ?"
-            values.append(self._limit)
+        limit_clause, limit_values = self._build_limit_clause(
+            exists_only=exists_only
+        )
+        sql += limit_clause
+        values.extend(limit_values)
 
-        if self._offset is not None:
-            sql += " OFFSET ?"
-            values.append(self._offset)
+        if windowed_count:
+            sql = f"SELECT COUNT(*) FROM ({sql})"  # noqa: S608 # nosec
 
         # Print the raw SQL and values if debug is enabled
         # Log the SQL if debug is enabled
@@ -575,6 +593,39 @@ class QueryBuilder:
         except sqlite3.Error as exc:
             raise RecordFetchError(self.table_name) from exc
 
+    def _build_limit_clause(
+        self, *, exists_only: bool = False
+    ) -> tuple[str, list[int]]:
+        """Build the LIMIT and OFFSET clause for the query.
+
+        Args:
+            exists_only: If True, limit the query to at most one row.
+
+        Returns:
+            A tuple containing the clause (or an empty string) and the values
+            for its placeholders.
+        """
+        clause = ""
+        values: list[int] = []
+        if exists_only:
+            # At most one row is needed, but a smaller (zero) limit from the
+            # caller still applies. A negative limit means no limit.
+            clause += " LIMIT ?"
+            values.append(
+                1
+                if self._limit is None or self._limit < 0
+                else min(self._limit, 1)
+            )
+        elif self._limit is not None:
+            clause += " LIMIT ?"
+            values.append(self._limit)
+
+        if self._offset is not None:
+            clause += " OFFSET ?"
+            values.append(self._offset)
+
+        return clause, values
+
     def _parse_filter(self) -> tuple[list[Any], LiteralString]:
         """Parse the filter conditions into SQL clauses and values.
 
@@ -600,27 +651,25 @@ class QueryBuilder:
         where_clause = " AND ".join(where_clauses)
         return values, where_clause
 
-    def _convert_row_to_model(self, row: tuple[Any, ...]) -> BaseDBModel:
+    def _convert_row_to_model(
+        self, row: tuple[Any, ...], field_names: tuple[str, ...]
+    ) -> BaseDBModel:
         """Convert a database row to a model instance.
 
         Args:
             row: A tuple representing a database row.
+            field_names: The field name of each column in the row, in order.
 
         Returns:
             An instance of the model class populated with the row data.
         """
-        if self._fields:
-            data = {
-                field: self._deserialize(field, row[idx])
-                for idx, field in enumerate(self._fields)
-            }
-            return self.model_class.model_validate_partial(data)
-
         data = {
-            field: self._deserialize(field, row[idx])
-            for idx, field in enumerate(self.model_class.model_fields)
+            field: self._deserialize(field, value)
+            for field, value in zip(field_names, row)
         }
-        return self.model_class(**data)
+        if self._fields:
+            return self.model_class.model_validate_partial(data)
+        return self.model_class.model_validate_row(data)
 
     def _deserialize(
         self, field_name: str, value: SerializableField
@@ -667,15 +716,18 @@ class QueryBuilder:
                 return None
             return []
 
+        # The column names are the same for every row, so get them once
+        field_names = tuple(self._fields or self.model_class.model_fields)
+
         if fetch_one:
             # Ensure we pass a tuple, not a list, to _convert_row_to_model
             if isinstance(result, list):
                 result = result[
                     0
                 ]  # Get the first (and only) result if it's wrapped in a list.
-            return self._convert_row_to_model(result)
+            return self._convert_row_to_model(result, field_names)
 
-        return [self._convert_row_to_model(row) for row in result]
+        return [self._convert_row_to_model(row, field_names) for row in result]
 
     def fetch_all(self) -> list[BaseDBModel]:
         """Fetch all results of the query.
@@ -715,6 +767,9 @@ class QueryBuilder:
     def count(self) -> int:
         """Count the number of results for the current query.
 
+        Any limit and offset set on the query are honoured, so this is the
+        number of records 'fetch_all()' would return.
+
         Returns:
             The number of results that match the current query conditions.
         """
@@ -725,10 +780,14 @@ class QueryBuilder:
     def exists(self) -> bool:
         """Check if any results exist for the current query.
 
+        This runs a 'SELECT 1 ... LIMIT 1' query rather than counting every
+        matching row, so SQLite can stop as soon as it finds a match. Any limit
+        and offset set on the query are honoured, as for 'count()'.
+
         Returns:
             True if at least one result exists, False otherwise.
         """
-        return self.count() > 0
+        return self._execute_query(fetch_one=True, exists_only=True) is not None
 
     def delete(self) -> int:
         """Delete records that match the current query conditions.
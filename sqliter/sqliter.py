@@ -15,6 +15,7 @@ from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union
 
 from typing_extensions import Self
 
+from sqliter.constants import STATEMENT_CACHE_SIZE
 from sqliter.exceptions import (
     DatabaseConnectionError,
     InvalidIndexError,
@@ -32,6 +33,7 @@ from sqliter.model.unique import Unique
 from sqliter.query.query import QueryBuilder
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Sequence
     from types import TracebackType
 
     from sqliter.model.model import BaseDBModel
@@ -236,7 +238,9 @@ class SqliterDB:
         """
         if not self.conn:
             try:
-                self.conn = sqlite3.connect(self.db_filename)
+                self.conn = sqlite3.connect(
+                    self.db_filename, cached_statements=STATEMENT_CACHE_SIZE
+                )
             except sqlite3.Error as exc:
                 raise DatabaseConnectionError(self.db_filename) from exc
         return self.conn
@@ -455,6 +459,131 @@ class SqliterDB:
         model_class = type(model_instance)
         table_name = model_class.get_table_name()
 
+        data = self._prepare_insert_data(
+            model_instance, timestamp_override=timestamp_override
+        )
+
+        # None values are bound as parameters (SQLite stores them as NULL) so
+        # the SQL only depends on the model's fields, and sqlite3 can reuse
+        # the same prepared statement for every insert into this table.
+        insert_sql = self._build_insert_sql(table_name, data)
+        values = tuple(data.values())
+
+        try:
+            with self.connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute(insert_sql, values)
+                self._maybe_commit()
+
+        except sqlite3.Error as exc:
+            raise RecordInsertionError(table_name) from exc
+        else:
+            data.pop("pk", None)
+            # Deserialize each field before creating the model instance
+            deserialized_data = {}
+            for field_name, value in data.items():
+                deserialized_data[field_name] = model_class.deserialize_field(
+                    field_name, value, return_local_time=self.return_local_time
+                )
+            return model_class(pk=cursor.lastrowid, **deserialized_data)
+
+    def bulk_insert(
+        self,
+        model_instances: Sequence[BaseDBModel],
+        *,
+        timestamp_override: bool = False,
+    ) -> int:
+        """Insert several records of the same model in a single operation.
+
+        The rows are sent to SQLite with 'executemany()' inside one
+        transaction, so the INSERT statement is only prepared once. The rows
+        are inserted in the order given. Unlike 'insert()', the inserted
+        instances are not returned.
+
+        Args:
+            model_instances: The model instances to insert. All of them must
+                be instances of the same model class.
+            timestamp_override: If True, override the created_at and updated_at
+                timestamps with provided values, as for 'insert()'.
+
+        Returns:
+            The number of records inserted.
+
+        Raises:
+            ValueError: If the instances are not all of the same model class.
+            RecordInsertionError: If an error occurs during the insertion.
+        """
+        if not model_instances:
+            return 0
+
+        model_class = type(model_instances[0])
+        if any(
+            type(instance) is not model_class for instance in model_instances
+        ):
+            err = "All instances must be of the same model class."
+            raise ValueError(err)
+        table_name = model_class.get_table_name()
+
+        # Rows with and without an explicit primary key need different SQL, so
+        # start a new batch whenever the column list changes. Consecutive runs
+        # keep the rows in their original order, and so their primary keys.
+        batches: list[tuple[tuple[str, ...], list[tuple[Any, ...]]]] = []
+        for instance in model_instances:
+            data = self._prepare_insert_data(
+                instance, timestamp_override=timestamp_override
+            )
+            columns = tuple(data)
+            if not batches or batches[-1][0] != columns:
+                batches.append((columns, []))
+            batches[-1][1].append(tuple(data.values()))
+
+        try:
+            with self.connect() as conn:
+                cursor = conn.cursor()
+                for columns, rows in batches:
+                    insert_sql = self._build_insert_sql(
+                        table_name, dict.fromkeys(columns)
+                    )
+                    cursor.executemany(insert_sql, rows)
+                self._maybe_commit()
+
+        except sqlite3.Error as exc:
+            raise RecordInsertionError(table_name) from exc
+
+        return len(model_instances)
+
+    @staticmethod
+    def _build_insert_sql(table_name: str, data: dict[str, Any]) -> str:
+        """Build the INSERT statement for the columns in 'data'.
+
+        Args:
+            table_name: The name of the table to insert into.
+            data: The data to insert, keyed by column name.
+
+        Returns:
+            The INSERT SQL, with a placeholder for each column.
+        """
+        fields = ", ".join(data.keys())
+        placeholders = ", ".join(["?"] * len(data))
+
+        return f"""
+        INSERT INTO {table_name} ({fields})
+        VALUES ({placeholders})
+        """  # noqa: S608
+
+    def _prepare_insert_data(
+        self, model_instance: BaseDBModel, *, timestamp_override: bool
+    ) -> dict[str, Any]:
+        """Set the timestamps on a model and return its serialized data.
+
+        Args:
+            model_instance: The instance of the model class to insert.
+            timestamp_override: If True, respect any timestamps already set on
+                the instance.
+
+        Returns:
+            The serialized column data, without the primary key if it is unset.
+        """
         # Always set created_at and updated_at timestamps
         current_timestamp = int(time.time())
 
@@ -482,34 +611,7 @@ class SqliterDB:
         if data.get("pk", None) == 0:
             data.pop("pk")
 
-        fields = ", ".join(data.keys())
-        placeholders = ", ".join(
-            ["?" if value is not None else "NULL" for value in data.values()]
-        )
-        values = tuple(value for value in data.values() if value is not None)
-
-        insert_sql = f"""
-        INSERT INTO {table_name} ({fields})
-        VALUES ({placeholders})
-        """  # noqa: S608
-
-        try:
-            with self.connect() as conn:
-                cursor = conn.cursor()
-                cursor.execute(insert_sql, values)
-                self._maybe_commit()
-
-        except sqlite3.Error as exc:
-            raise RecordInsertionError(table_name) from exc
-        else:
-            data.pop("pk", None)
-            # Deserialize each field before creating the model instance
-            deserialized_data = {}
-            for field_name, value in data.items():
-                deserialized_data[field_name] = model_class.deserialize_field(
-                    field_name, value, return_local_time=self.return_local_time
-                )
-            return model_class(pk=cursor.lastrowid, **deserialized_data)
+        return data
 
     def get(
         self, model_class: type[BaseDBModel], primary_key_value: int
@@ -556,7 +658,7 @@ class SqliterDB:
                             return_local_time=self.return_local_time,
                         )
                     )
-                return model_class(**deserialized_data)
+                return model_class.model_validate_row(deserialized_data)
         except sqlite3.Error as exc:
             raise RecordFetchError(table_name) from exc
         else:
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import os
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, Optional, Union
+from typing import TYPE_CHECKING, Any, ClassVar, Optional, Union
 
 import pytest
 
@@ -75,6 +75,8 @@ class DetailedPersonModel(BaseDBModel):
         """Configuration for the model."""
 
         table_name = "detailed_person_table"
+        # The filter and ordering tests use these columns
+        indexes: ClassVar[list[str]] = ["age", "name"]
 
 
 class ComplexModel(BaseDBModel):
@@ -90,6 +92,13 @@ class ComplexModel(BaseDBModel):
         """Configuration for the model."""
 
         table_name = "complex_model"
+        indexes: ClassVar[list[str]] = ["age", "name"]
+
+
+# Models defer building their Pydantic schema until first use. Build the shared
+# ones now so that cost isn't added to whichever test happens to run first.
+for _model in (ExampleModel, PersonModel, DetailedPersonModel, ComplexModel):
+    _model.model_rebuild()
 
 
 @pytest.fixture
@@ -113,16 +122,17 @@ def db_mock_adv() -> SqliterDB:
     return db
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def db_mock_detailed() -> SqliterDB:
     """Fixture to create a SqliterDB class with detailed person data.
 
-    This will be used to test advanced field selection.
+    This will be used to test advanced field selection. The database is built
+    once per session, so tests using it must treat it as read-only.
     """
     db = SqliterDB(memory_db)
     db.create_table(DetailedPersonModel)
 
-    db.insert(
+    people = [
         DetailedPersonModel(
             name="Alice",
             age=25,
@@ -130,9 +140,7 @@ def db_mock_detailed() -> SqliterDB:
             address="123 Main St",
             phone="555-1234",
             occupation="Engineer",
-        )
-    )
-    db.insert(
+        ),
         DetailedPersonModel(
             name="Bob",
             age=30,
@@ -140,9 +148,7 @@ def db_mock_detailed() -> SqliterDB:
             address="456 Elm St",
             phone="555-5678",
             occupation="Designer",
-        )
-    )
-    db.insert(
+        ),
         DetailedPersonModel(
             name="Charlie",
             age=35,
@@ -150,8 +156,9 @@ def db_mock_detailed() -> SqliterDB:
             address="789 Oak St",
             phone="555-9012",
             occupation="Manager",
-        )
-    )
+        ),
+    ]
+    db.bulk_insert(people)
 
     return db
 
@@ -153,6 +153,36 @@ class TestDates:
         assert fetched.date_field == test_date
         assert fetched.datetime_field == test_datetime
 
+    def test_date_field_partial_select(self, db_mock) -> None:
+        """Test that date fields can be selected on their own."""
+        test_datetime = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+        test_date = date(2024, 1, 1)
+
+        class DateModel(BaseDBModel):
+            name: str
+            date_field: date
+            datetime_field: datetime
+
+            class Meta:
+                table_name = "date_partial_table"
+
+        db_mock.create_table(DateModel)
+        db_mock.insert(
+            DateModel(
+                name="test", date_field=test_date, datetime_field=test_datetime
+            )
+        )
+
+        fetched = (
+            db_mock.select(DateModel)
+            .fields(["date_field", "datetime_field"])
+            .fetch_one()
+        )
+
+        assert fetched is not None
+        assert fetched.date_field == test_date
+        assert fetched.datetime_field == test_datetime
+
     def test_datetime_different_timezones(self, db_mock) -> None:
         """Test handling of datetimes in different timezones."""
         from datetime import timedelta, timezone
@@ -268,6 +298,16 @@ class TestDates:
             == datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc).timestamp()
         )
 
+        # The same values come back through select()
+        selected = (
+            db_mock.select(OptionalDateModel)
+            .filter(name="with_dates")
+            .fetch_one()
+        )
+        assert selected is not None
+        assert selected.date_field == date(2024, 1, 1)
+        assert isinstance(selected.dt_field, datetime)
+
     def test_update_date_fields(self, db_mock) -> None:
         """Test updating date and datetime fields."""
 
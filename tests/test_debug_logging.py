@@ -253,6 +253,20 @@ class TestDebugLogging:
             '"nullable_field" FROM "complex_model"' in caplog.text
         )
 
+    def test_debug_sql_output_exists(
+        self, db_mock_complex_debug: SqliterDB, caplog
+    ) -> None:
+        """Test exists() stops at the first match and ignores ordering."""
+        with caplog.at_level(logging.DEBUG):
+            db_mock_complex_debug.select(ComplexModel).filter(
+                name="Alice"
+            ).order("age").exists()
+
+        assert (
+            'Executing SQL: SELECT 1 FROM "complex_model" '
+            "WHERE name = 'Alice' LIMIT 1" in caplog.text
+        )
+
     def test_debug_output_drop_table(
         self, db_mock_complex_debug: SqliterDB, caplog
     ) -> None:
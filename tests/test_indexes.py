@@ -23,6 +23,23 @@ def get_index_names(db: SqliterDB) -> list[str]:
 class TestIndexes:
     """Test cases for index creation in the database."""
 
+    def test_fixture_indexes_used_by_filter(
+        self, db_mock_detailed: SqliterDB
+    ) -> None:
+        """Test that filtering on an indexed column uses the index."""
+        assert "idx_detailed_person_table_age" in get_index_names(
+            db_mock_detailed
+        )
+
+        conn = db_mock_detailed.connect()
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT name FROM detailed_person_table "
+            "WHERE age = ?",
+            (30,),
+        ).fetchall()
+
+        assert any("idx_detailed_person_table_age" in row[-1] for row in plan)
+
     def test_regular_index_creation(self, mocker: MockerFixture) -> None:
         """Test that regular indexes are created for valid fields."""
         mock_execute = mocker.patch.object(SqliterDB, "_execute_sql")
@@ -1,9 +1,13 @@
 """Specific tests for the Model and it's methods."""
 
-from typing import Optional
+import sys
+from enum import Enum
+from typing import Annotated, Literal, Optional
 
 import pytest
+from pydantic import AfterValidator, Field, ValidationError, field_validator
 
+from sqliter import SqliterDB
 from sqliter.model.model import BaseDBModel
 
 
@@ -35,6 +39,43 @@ class TestBaseDBModel:
 
         assert TestModel.get_table_name() == "custom_table"
 
+    def test_get_table_name_cached_on_class(self, mocker) -> None:
+        """Test that the table name is computed once when the class is made."""
+
+        class TestModel(BaseDBModel):
+            class Meta:
+                table_name = "cached_table"
+
+        class ChildModel(TestModel):
+            class Meta:
+                table_name = "child_table"
+
+        assert TestModel.__dict__["_table_name"] == "cached_table"
+        assert ChildModel.__dict__["_table_name"] == "child_table"
+
+        spy = mocker.spy(TestModel, "_derive_table_name")
+        assert TestModel.get_table_name() == "cached_table"
+        assert ChildModel.get_table_name() == "child_table"
+        spy.assert_not_called()
+
+    def test_get_table_name_uncached(self) -> None:
+        """Test the table name is derived for a class without a cached one."""
+        assert BaseDBModel.__dict__["_table_name"] is None
+        assert BaseDBModel.get_table_name() == "base_d_bs"
+
+    def test_schema_build_deferred_until_first_use(self) -> None:
+        """Test that the Pydantic schema is only built on first use."""
+
+        class TestModel(BaseDBModel):
+            name: str
+
+        assert TestModel.__pydantic_complete__ is False
+        assert "name" in TestModel.model_fields
+
+        TestModel(name="John")
+
+        assert TestModel.__pydantic_complete__ is True
+
     def test_model_validate_partial(self) -> None:
         """Test 'model_validate_partial' with partial data."""
 
@@ -47,3 +88,201 @@ class TestBaseDBModel:
         assert model_instance.name == "John"
         with pytest.raises(AttributeError):
             _ = model_instance.age
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 10), reason="PEP 604 unions need Python 3.10+"
+    )
+    def test_model_validate_partial_pep604_union(self) -> None:
+        """Test 'model_validate_partial' treats 'X | None' like Optional[X]."""
+
+        class TestModel(BaseDBModel):
+            age: int | None  # noqa: FA102
+
+        model_instance = TestModel.model_validate_partial({"age": "42"})
+        assert model_instance.age == 42
+
+    def test_model_validate_partial_converters_cached(self) -> None:
+        """Test the partial validation converters are built once per class."""
+
+        class TestModel(BaseDBModel):
+            name: str
+            age: Optional[int]
+
+        assert "_partial_converters" not in TestModel.__dict__
+
+        model_instance = TestModel.model_validate_partial(
+            {"name": "John", "age": "42"}
+        )
+        assert model_instance.age == 42
+
+        converters = TestModel.__dict__["_partial_converters"]
+        assert set(converters) == set(TestModel.model_fields)
+
+        TestModel.model_validate_partial({"age": None})
+        assert TestModel.__dict__["_partial_converters"] is converters
+
+    def test_fetch_skips_validation_without_custom_validators(
+        self, mocker
+    ) -> None:
+        """Test full rows are built without running Pydantic validation."""
+
+        class TestModel(BaseDBModel):
+            name: str
+            is_active: bool
+
+        db = SqliterDB(memory=True)
+        db.create_table(TestModel)
+        db.insert(TestModel(name="John", is_active=True))
+
+        spy = mocker.spy(TestModel, "model_construct")
+        result = db.select(TestModel).fetch_one()
+
+        assert TestModel.has_custom_validators() is False
+        spy.assert_called_once()
+        assert result is not None
+        assert result.is_active is True
+        assert result.model_fields_set == set(TestModel.model_fields)
+
+    def test_fetch_validates_with_custom_validators(self) -> None:
+        """Test models with their own validators are validated on fetch."""
+
+        class TestModel(BaseDBModel):
+            name: str
+
+            @field_validator("name")
+            @classmethod
+            def upper_name(cls, value: str) -> str:
+                return value.upper()
+
+        db = SqliterDB(memory=True)
+        db.create_table(TestModel)
+        with db.connect() as conn:
+            conn.execute(
+                "INSERT INTO tests (created_at, updated_at, name) "
+                "VALUES (0, 0, 'john')"
+            )
+
+        result = db.select(TestModel).fetch_one()
+
+        assert TestModel.has_custom_validators() is True
+        assert result is not None
+        assert result.name == "JOHN"
+
+    def test_fetch_optional_bool_false(self) -> None:
+        """Test a False 'Optional[bool]' in a TEXT column is read as False."""
+
+        class TestModel(BaseDBModel):
+            is_active: Optional[bool] = None
+
+        db = SqliterDB(memory=True)
+        db.create_table(TestModel)
+        db.insert(TestModel(is_active=False))
+        db.insert(TestModel(is_active=True))
+
+        results = db.select(TestModel).fetch_all()
+
+        assert [result.is_active for result in results] == [False, True]
+
+    def test_fetch_literal_field(self) -> None:
+        """Test a 'Literal' field is read back without an error."""
+
+        class TestModel(BaseDBModel):
+            status: Literal["active", "inactive"]
+
+        db = SqliterDB(memory=True)
+        db.create_table(TestModel)
+        db.insert(TestModel(status="inactive"))
+
+        result = db.select(TestModel).fetch_one()
+        partial = db.select(TestModel, fields=["status"]).fetch_one()
+
+        assert result is not None
+        assert result.status == "inactive"
+        assert partial is not None
+        assert partial.status == "inactive"
+
+    def test_fetch_validates_with_annotated_validators(self) -> None:
+        """Test 'Annotated' validators run on fetch."""
+
+        class TestModel(BaseDBModel):
+            name: Annotated[str, AfterValidator(str.upper)]
+
+        db = SqliterDB(memory=True)
+        db.create_table(TestModel)
+        with db.connect() as conn:
+            conn.execute(
+                "INSERT INTO tests (created_at, updated_at, name) "
+                "VALUES (0, 0, 'john')"
+            )
+
+        result = db.select(TestModel).fetch_one()
+        record = db.get(TestModel, 1)
+
+        assert TestModel.has_custom_validators() is True
+        assert result is not None
+        assert result.name == "JOHN"
+        assert record is not None
+        assert record.name == "JOHN"
+
+    @pytest.mark.parametrize(
+        ("column", "value"),
+        [("number", "'abc'"), ("color", "'green'"), ("count", "-5")],
+    )
+    def test_fetch_invalid_row_raises(self, column: str, value: str) -> None:
+        """Test a stored value that does not fit its field is not accepted."""
+
+        class Color(str, Enum):
+            RED = "red"
+            BLUE = "blue"
+
+        class TestModel(BaseDBModel):
+            number: int = 1
+            color: Color = Color.RED
+            count: int = Field(default=0, ge=0)
+
+        db = SqliterDB(memory=True)
+        db.create_table(TestModel)
+        with db.connect() as conn:
+            conn.execute(
+                "INSERT INTO tests (created_at, updated_at, number, color, "
+                "count) VALUES (0, 0, 1, 'red', 0)"
+            )
+            conn.execute(
+                f"UPDATE tests SET {column} = {value}"  # noqa: S608
+            )
+
+        with pytest.raises(ValidationError):
+            db.select(TestModel).fetch_one()
+        with pytest.raises(ValidationError):
+            db.get(TestModel, 1)
+        with pytest.raises(ValidationError):
+            db.select(TestModel, fields=[column]).fetch_one()
+
+    def test_get_skips_validation_without_custom_validators(
+        self, mocker
+    ) -> None:
+        """Test 'get' builds the record without running Pydantic validation."""
+
+        class TestModel(BaseDBModel):
+            name: str
+            is_active: bool
+            is_admin: Optional[bool] = None
+            status: Literal["active", "inactive"] = "active"
+
+        db = SqliterDB(memory=True)
+        db.create_table(TestModel)
+        inserted = db.insert(
+            TestModel(
+                name="John", is_active=False, is_admin=False, status="inactive"
+            )
+        )
+
+        spy = mocker.spy(TestModel, "model_construct")
+        result = db.get(TestModel, inserted.pk)
+
+        spy.assert_called_once()
+        assert isinstance(result, TestModel)
+        assert result.name == "John"
+        assert result.is_active is False
+        assert result.is_admin is False
+        assert result.status == "inactive"
@@ -1,5 +1,7 @@
 """Tests for selecting specific fields from a model."""
 
+import re
+from collections.abc import Set as AbstractSet
 from typing import Union, cast
 
 import pytest
@@ -8,72 +10,99 @@ from sqliter import SqliterDB
 from sqliter.model.model import BaseDBModel
 from tests.conftest import DetailedPersonModel, PersonModel
 
+# Field names of 'DetailedPersonModel', computed once for the whole module.
+# '_MODEL_FIELDS' includes the inherited 'pk' and timestamp fields, while
+# '_DETAILED_FIELDS' only has the fields the model itself declares.
+_MODEL_FIELDS = frozenset(DetailedPersonModel.model_fields)
+_DETAILED_FIELDS = _MODEL_FIELDS - frozenset(BaseDBModel.model_fields)
+_ALL_FIELDS_LIST = ["name", "age", "email", "address", "phone", "occupation"]
+
+# Expected error messages for the failure-path tests.
+_ERR_NONEXISTENT = re.compile(r"Invalid fields specified: nonexistent")
+_ERR_NONEXISTENT_FIELD = re.compile(
+    r"Invalid fields specified: nonexistent_field$"
+)
+_ERR_EXCLUDE_ALL = re.compile(
+    r"Exclusion results in no fields being selected\."
+)
+_ERR_EXCLUDE_INVALID = re.compile(
+    r"Invalid fields specified for exclusion: invalid_field"
+)
+_ERR_ONLY_INVALID = re.compile(r"Invalid field specified: invalid_field")
+
+
+class _PartialUnionModel(BaseDBModel):
+    """Model whose only field is a Union none of its members can parse."""
+
+    field_a: Union[int, float]
+
+
+def _assert_fields(result: BaseDBModel, expected: AbstractSet[str]) -> None:
+    """Assert exactly the 'expected' model fields were loaded on 'result'.
+
+    Fields that were not loaded must not be set on the instance at all, so
+    accessing them raises an AttributeError.
+    """
+    assert _DETAILED_FIELDS.intersection(result.model_fields_set) == expected
+    for field in _DETAILED_FIELDS - expected:
+        assert not hasattr(result, field)
+
 
 class TestOptionalFields:
     """Test cases for selecting specific fields from a model."""
 
-    def test_select_specific_fields(self, db_mock_detailed: SqliterDB) -> None:
+    @pytest.mark.parametrize(
+        "fields",
+        [
+            ["name", "age"],
+            ["name", "email", "occupation"],
+            ["name"],
+            _ALL_FIELDS_LIST,
+        ],
+        ids=["two", "three", "single", "all"],
+    )
+    def test_select_specific_fields(
+        self, db_mock_detailed: SqliterDB, fields: list[str]
+    ) -> None:
         """Test selecting specific fields from a model."""
         results = db_mock_detailed.select(
-            DetailedPersonModel, fields=["name", "age"]
-        ).fetch_all()
-        assert len(results) == 3
-        for result in results:
-            assert hasattr(result, "name")
-            assert hasattr(result, "age")
-            assert not hasattr(result, "email")
-            assert not hasattr(result, "address")
-            assert not hasattr(result, "phone")
-            assert not hasattr(result, "occupation")
-
-    def test_select_multiple_fields(self, db_mock_detailed: SqliterDB) -> None:
-        """Test selecting multiple specific fields from a model."""
-        results = db_mock_detailed.select(
-            DetailedPersonModel, fields=["name", "email", "occupation"]
+            DetailedPersonModel, fields=list(fields)
         ).fetch_all()
         assert len(results) == 3
         for result in results:
-            assert hasattr(result, "name")
-            assert hasattr(result, "email")
-            assert hasattr(result, "occupation")
-            assert not hasattr(result, "age")
-            assert not hasattr(result, "address")
-            assert not hasattr(result, "phone")
+            _assert_fields(result, set(fields))
 
     def test_select_all_fields(self, db_mock_detailed: SqliterDB) -> None:
+        """Test that selecting no specific fields returns every record."""
+        assert db_mock_detailed.select(DetailedPersonModel).count() == 3
+
+    def test_select_all_fields_presence(
+        self, db_mock_detailed: SqliterDB
+    ) -> None:
         """Test that selecting no specific fields returns all fields."""
-        results = db_mock_detailed.select(DetailedPersonModel).fetch_all()
-        assert len(results) == 3
-        for result in results:
-            assert hasattr(result, "name")
-            assert hasattr(result, "age")
-            assert hasattr(result, "email")
-            assert hasattr(result, "address")
-            assert hasattr(result, "phone")
-            assert hasattr(result, "occupation")
+        result = db_mock_detailed.select(DetailedPersonModel).fetch_first()
+        assert result is not None
+        _assert_fields(result, _DETAILED_FIELDS)
 
     def test_select_with_filter(self, db_mock_detailed: SqliterDB) -> None:
         """Test selecting specific fields with a filter applied."""
-        results = (
+        result = (
             db_mock_detailed.select(
                 DetailedPersonModel, fields=["name", "occupation"]
             )
             .filter(age=30)
-            .fetch_all()
+            .fetch_first()
         )
-        assert len(results) == 1
-        assert results[0].name == "Bob"
-        assert results[0].occupation == "Designer"
-        assert not hasattr(results[0], "age")
-        assert not hasattr(results[0], "email")
-        assert not hasattr(results[0], "address")
-        assert not hasattr(results[0], "phone")
+        assert result is not None
+        assert result.name == "Bob"
+        assert result.occupation == "Designer"
+        _assert_fields(result, {"name", "occupation"})
 
     def test_select_nonexistent_field(
         self, db_mock_detailed: SqliterDB
     ) -> None:
         """Test that selecting a nonexistent field raises an error."""
-        with pytest.raises(ValueError):  # noqa: PT011
+        with pytest.raises(ValueError, match=_ERR_NONEXISTENT):
             db_mock_detailed.select(
                 DetailedPersonModel, fields=["nonexistent"]
             ).fetch_all()
@@ -89,26 +118,7 @@ class TestOptionalFields:
         full_results = db_mock_detailed.select(DetailedPersonModel).fetch_all()
         assert len(full_results) == 3
         for result in full_results:
-            assert hasattr(result, "name")
-            assert hasattr(result, "age")
-            assert hasattr(result, "email")
-            assert hasattr(result, "address")
-            assert hasattr(result, "phone")
-            assert hasattr(result, "occupation")
-
-    def test_select_single_field(self, db_mock_detailed: SqliterDB) -> None:
-        """Test selecting just a single field from a model."""
-        results = db_mock_detailed.select(
-            DetailedPersonModel, fields=["name"]
-        ).fetch_all()
-        assert len(results) == 3
-        for result in results:
-            assert hasattr(result, "name")
-            assert not hasattr(result, "age")
-            assert not hasattr(result, "email")
-            assert not hasattr(result, "address")
-            assert not hasattr(result, "phone")
-            assert not hasattr(result, "occupation")
+            _assert_fields(result, _DETAILED_FIELDS)
 
     def test_select_fields_with_filter(
         self, db_mock_detailed: SqliterDB
@@ -121,23 +131,8 @@ class TestOptionalFields:
         )
         assert len(results) == 2
         for result in results:
-            assert hasattr(result, "name")
-            assert hasattr(result, "age")
+            _assert_fields(result, {"name", "age"})
             assert result.age > 25
-            assert not hasattr(result, "email")
-
-    def test_select_all_fields_explicitly(
-        self, db_mock_detailed: SqliterDB
-    ) -> None:
-        """Test selecting all fields explicitly."""
-        all_fields = ["name", "age", "email", "address", "phone", "occupation"]
-        results = db_mock_detailed.select(
-            DetailedPersonModel, fields=all_fields
-        ).fetch_all()
-        assert len(results) == 3
-        for result in results:
-            for field in all_fields:
-                assert hasattr(result, field)
 
     def test_select_no_fields(self, db_mock_detailed: SqliterDB) -> None:
         """Test that passing an empty fields arg returns all fields."""
@@ -147,10 +142,7 @@ class TestOptionalFields:
         assert len(results) == 3
         for result in results:
             assert isinstance(result, DetailedPersonModel)
-            assert all(
-                hasattr(result, field)
-                for field in DetailedPersonModel.__annotations__
-            )
+            assert all(hasattr(result, field) for field in _MODEL_FIELDS)
 
     def test_select_fields_with_ordering(
         self, db_mock_detailed: SqliterDB
@@ -164,9 +156,7 @@ class TestOptionalFields:
         assert len(results) == 3
         assert results[0].age > results[1].age > results[2].age
         for result in results:
-            assert hasattr(result, "name")
-            assert hasattr(result, "age")
-            assert not hasattr(result, "email")
+            _assert_fields(result, {"name", "age"})
 
     def test_select_fields_with_limit_offset(
         self, db_mock_detailed: SqliterDB
@@ -182,21 +172,28 @@ class TestOptionalFields:
         )
         assert len(results) == 2
         for result in results:
-            assert hasattr(result, "name")
-            assert hasattr(result, "email")
-            assert not hasattr(result, "age")
+            _assert_fields(result, {"name", "email"})
 
     def test_select_nonexistent_fields(
         self, db_mock_detailed: SqliterDB
     ) -> None:
         """Test selecting a nonexistent fields raises an error."""
-        with pytest.raises(
-            ValueError, match="Invalid fields specified: nonexistent_field"
-        ):
+        with pytest.raises(ValueError, match=_ERR_NONEXISTENT_FIELD):
             db_mock_detailed.select(
                 DetailedPersonModel, fields=["name", "nonexistent_field"]
             ).fetch_all()
 
+    def test_select_nonexistent_fields_sorted_in_error(
+        self, db_mock_detailed: SqliterDB
+    ) -> None:
+        """Test the invalid fields are listed in a stable, sorted order."""
+        with pytest.raises(
+            ValueError, match="Invalid fields specified: bogus, missing, zzz"
+        ):
+            db_mock_detailed.select(
+                DetailedPersonModel, fields=["zzz", "name", "missing", "bogus"]
+            )
+
     def test_original_model_unaffected(
         self, db_mock_detailed: SqliterDB
     ) -> None:
@@ -207,32 +204,25 @@ class TestOptionalFields:
         full_results = db_mock_detailed.select(DetailedPersonModel).fetch_all()
         assert len(full_results) == 3
         for result in full_results:
-            assert all(
-                hasattr(result, field)
-                for field in DetailedPersonModel.__annotations__
-            )
+            assert all(hasattr(result, field) for field in _MODEL_FIELDS)
 
     def test_field_types_maintained(self, db_mock_detailed: SqliterDB) -> None:
         """Ensure that the field types are maintained when selecting fields."""
         results = db_mock_detailed.select(
             DetailedPersonModel, fields=["name", "age"]
         ).fetch_all()
-        assert len(results) > 0
-        for result in results:
-            assert isinstance(result.name, str)
-            assert isinstance(result.age, int)
-
-    def test_model_validate_partial_else_block(self) -> None:
-        """Test where the for/else block is hit in model_validate_partial."""
-
-        class TestModel(BaseDBModel):
-            field_a: Union[int, float]
+        # Every row shares the same column types, so one row is enough
+        assert results
+        assert isinstance(results[0].name, str)
+        assert isinstance(results[0].age, int)
 
+    def test_model_validate_partial_unparsable_union_value(self) -> None:
+        """Test a Union value that no member accepts is returned unchanged."""
         invalid_value = "string"
 
         obj = {"field_a": invalid_value}
 
-        result = TestModel.model_validate_partial(obj)
+        result = _PartialUnionModel.model_validate_partial(obj)
 
         assert cast(str, result.field_a) == invalid_value
 
@@ -240,30 +230,25 @@ class TestOptionalFields:
         self, db_mock_detailed: SqliterDB
     ) -> None:
         """Test selecting all fields explicitly."""
-        all_fields = ["name", "age", "email", "address", "phone", "occupation"]
         results = (
             db_mock_detailed.select(DetailedPersonModel)
-            .fields(all_fields)
+            .fields(list(_ALL_FIELDS_LIST))
             .fetch_all()
         )
         assert len(results) == 3
         for result in results:
-            for field in all_fields:
-                assert hasattr(result, field)
+            _assert_fields(result, _DETAILED_FIELDS)
 
     def test_fields_operator_no_fields_explicitly(
         self, db_mock_detailed: SqliterDB
     ) -> None:
         """Test selecting all fields explicitly."""
-        all_fields = ["name", "age", "email", "address", "phone", "occupation"]
-
         results = (
             db_mock_detailed.select(DetailedPersonModel).fields().fetch_all()
         )
         assert len(results) == 3
         for result in results:
-            for field in all_fields:
-                assert hasattr(result, field)
+            _assert_fields(result, _DETAILED_FIELDS)
 
     def test_validate_fields_with_none(self, db_mock_adv) -> None:
         """Test _validate_fields with self._fields set to None."""
@@ -286,54 +271,48 @@ class TestOptionalFields:
 
         # No assertion needed since we're testing for the absence of exceptions
 
-    def test_fetch_one_with_specific_fields(
-        self, db_mock_detailed: SqliterDB
-    ) -> None:
-        """Test fetch_one selecting specific fields."""
-        result = db_mock_detailed.select(
-            DetailedPersonModel, fields=["name", "email"]
-        ).fetch_one()
-
-        assert result is not None
-        assert hasattr(result, "name")
-        assert hasattr(result, "email")
-        assert not hasattr(result, "age")
-        assert not hasattr(result, "address")
-        assert not hasattr(result, "phone")
-        assert not hasattr(result, "occupation")
-
-    def test_fetch_first_with_specific_fields(
-        self, db_mock_detailed: SqliterDB
+    def test_validate_fields_uses_cached_field_names(
+        self, db_mock_adv: SqliterDB
     ) -> None:
-        """Test fetch_first selecting specific fields."""
-        result = db_mock_detailed.select(
-            DetailedPersonModel, fields=["name", "age"]
-        ).fetch_first()
-
-        assert result is not None
-        assert hasattr(result, "name")
-        assert hasattr(result, "age")
-        assert not hasattr(result, "email")
-        assert not hasattr(result, "address")
-        assert not hasattr(result, "phone")
-        assert not hasattr(result, "occupation")
-
-    def test_fetch_last_with_specific_fields(
-        self,
-        db_mock_detailed: SqliterDB,
+        """Test the valid field names are cached on the model class."""
+        db_mock_adv.select(PersonModel, fields=["name"])
+        field_names = PersonModel.__dict__["_field_names"]
+
+        db_mock_adv.select(PersonModel, fields=["age"])
+
+        assert field_names == frozenset(PersonModel.model_fields)
+        assert PersonModel.__dict__["_field_names"] is field_names
+
+    def test_select_all_columns_cached(self, db_mock_adv: SqliterDB) -> None:
+        """Test the full column list is cached on the model class."""
+        db_mock_adv.select(PersonModel).fetch_all()
+        columns = PersonModel.__dict__["_select_columns"]
+
+        db_mock_adv.select(PersonModel).filter(age=30).fetch_all()
+
+        assert columns == '"pk", "created_at", "updated_at", "name", "age"'
+        assert PersonModel.__dict__["_select_columns"] is columns
+
+    @pytest.mark.parametrize(
+        ("method", "fields"),
+        [
+            ("fetch_one", ["name", "email"]),
+            ("fetch_first", ["name", "age"]),
+            ("fetch_last", ["name", "occupation"]),
+        ],
+        ids=["fetch_one", "fetch_first", "fetch_last"],
+    )
+    def test_fetch_single_with_specific_fields(
+        self, db_mock_detailed: SqliterDB, method: str, fields: list[str]
     ) -> None:
-        """Test fetch_last selecting specific fields."""
-        result = db_mock_detailed.select(
-            DetailedPersonModel, fields=["name", "occupation"]
-        ).fetch_last()
+        """Test fetch_one/first/last selecting specific fields."""
+        query = db_mock_detailed.select(
+            DetailedPersonModel, fields=list(fields)
+        )
+        result = getattr(query, method)()
 
         assert result is not None
-        assert hasattr(result, "name")
-        assert hasattr(result, "occupation")
-        assert not hasattr(result, "age")
-        assert not hasattr(result, "email")
-        assert not hasattr(result, "address")
-        assert not hasattr(result, "phone")
+        _assert_fields(result, set(fields))
 
     def test_fields_overrides_select(self, db_mock_adv: SqliterDB) -> None:
         """Ensure that the fields() method overrides select() method fields."""
@@ -344,9 +323,10 @@ class TestOptionalFields:
             .fetch_all()
         )
 
-        # Ensure only 'age' is present, as 'fields()' was called last
-        assert all(hasattr(person, "age") for person in result)
-        assert all(not hasattr(person, "name") for person in result)
+        # Ensure only 'age' is present, as 'fields()' was called last. Every
+        # row is built from the same column list, so checking one is enough.
+        assert result
+        assert {"name", "age"} & result[0].model_fields_set == {"age"}
 
     def test_fields_overrides_select_with_overlap(
         self,
@@ -365,12 +345,8 @@ class TestOptionalFields:
 
         # Ensure only 'age' and 'email' are present, as 'fields()' was called
         # last
-        assert all(hasattr(person, "age") for person in result)
-        assert all(hasattr(person, "email") for person in result)
-        assert all(not hasattr(person, "name") for person in result)
-        assert all(not hasattr(person, "address") for person in result)
-        assert all(not hasattr(person, "phone") for person in result)
-        assert all(not hasattr(person, "occupation") for person in result)
+        assert result
+        _assert_fields(result[0], {"age", "email"})
 
     def test_exclude_single_field(self, db_mock_detailed: SqliterDB) -> None:
         """Test excluding a single field."""
@@ -381,9 +357,7 @@ class TestOptionalFields:
         )
         assert len(results) == 3
         for result in results:
-            assert hasattr(result, "name")
-            assert hasattr(result, "age")
-            assert not hasattr(result, "email")
+            _assert_fields(result, _DETAILED_FIELDS - {"email"})
 
     def test_exclude_multiple_fields(self, db_mock_detailed: SqliterDB) -> None:
         """Test excluding multiple fields."""
@@ -394,19 +368,15 @@ class TestOptionalFields:
         )
         assert len(results) == 3
         for result in results:
-            assert hasattr(result, "name")
-            assert hasattr(result, "age")
-            assert not hasattr(result, "email")
-            assert not hasattr(result, "phone")
-            assert not hasattr(result, "occupation")
+            _assert_fields(
+                result, _DETAILED_FIELDS - {"email", "phone", "occupation"}
+            )
 
     def test_exclude_all_fields_error(
         self, db_mock_detailed: SqliterDB
     ) -> None:
         """Test excluding all fields raises an error."""
-        with pytest.raises(
-            ValueError, match="Exclusion results in no fields being selected."
-        ):
+        with pytest.raises(ValueError, match=_ERR_EXCLUDE_ALL):
             db_mock_detailed.select(DetailedPersonModel).exclude(
                 fields=[
                     "name",
@@ -422,10 +392,7 @@ class TestOptionalFields:
 
     def test_exclude_invalid_field(self, db_mock_detailed: SqliterDB) -> None:
         """Test excluding an invalid field raises an error."""
-        with pytest.raises(
-            ValueError,
-            match="Invalid fields specified for exclusion: invalid_field",
-        ):
+        with pytest.raises(ValueError, match=_ERR_EXCLUDE_INVALID):
             db_mock_detailed.select(DetailedPersonModel).exclude(
                 fields=["invalid_field"]
             ).fetch_all()
@@ -440,9 +407,7 @@ class TestOptionalFields:
         )
         assert len(results) == 2
         for result in results:
-            assert hasattr(result, "name")
-            assert hasattr(result, "email")
-            assert not hasattr(result, "phone")
+            _assert_fields(result, _DETAILED_FIELDS - {"phone"})
 
     def test_exclude_with_no_fields(self, db_mock_detailed: SqliterDB) -> None:
         """Test calling exclude with no fields has no effect."""
@@ -453,11 +418,7 @@ class TestOptionalFields:
         )
         assert len(results) == 3
         for result in results:
-            assert hasattr(result, "name")
-            assert hasattr(result, "age")
-            assert hasattr(result, "email")
-            assert hasattr(result, "phone")
-            assert hasattr(result, "occupation")
+            _assert_fields(result, _DETAILED_FIELDS)
 
     def test_only_method_with_single_field(
         self, db_mock_detailed: SqliterDB
@@ -470,9 +431,7 @@ class TestOptionalFields:
         )
         assert len(results) == 3
         for result in results:
-            assert hasattr(result, "name")
-            assert not hasattr(result, "age")
-            assert not hasattr(result, "email")
+            _assert_fields(result, {"name"})
 
     def test_only_with_list_raises_type_error(
         self,
@@ -496,10 +455,7 @@ class TestOptionalFields:
 
     def test_only_with_invalid_field(self, db_mock_detailed: SqliterDB) -> None:
         """Test that only() raises ValueError with invalid field."""
-        with pytest.raises(
-            ValueError,
-            match="Invalid field specified: invalid_field",
-        ):
+        with pytest.raises(ValueError, match=_ERR_ONLY_INVALID):
             db_mock_detailed.select(DetailedPersonModel).only(
                 "invalid_field"
             ).fetch_all()
@@ -6,29 +6,33 @@ from sqliter import SqliterDB
 from tests.conftest import ComplexModel
 
 
-@pytest.fixture
-def db_mock_complex(db_mock: SqliterDB) -> SqliterDB:
-    """Fixture for a mock database with a complex model."""
+@pytest.fixture(scope="module")
+def db_mock_complex() -> SqliterDB:
+    """Fixture for a mock database with a complex model.
+
+    The database is built once for this module, as every test only reads it.
+    """
+    db_mock = SqliterDB(memory=True)
     db_mock.create_table(ComplexModel)
-    db_mock.insert(
-        ComplexModel(
-            pk=1,
-            name="Alice",
-            age=30.5,
-            is_active=True,
-            score=85,
-            nullable_field="Not null",
-        )
-    )
-    db_mock.insert(
-        ComplexModel(
-            pk=2,
-            name="Bob",
-            age=25.0,
-            is_active=False,
-            score=90.5,
-            nullable_field=None,
-        )
+    db_mock.bulk_insert(
+        [
+            ComplexModel(
+                pk=1,
+                name="Alice",
+                age=30.5,
+                is_active=True,
+                score=85,
+                nullable_field="Not null",
+            ),
+            ComplexModel(
+                pk=2,
+                name="Bob",
+                age=25.0,
+                is_active=False,
+                score=90.5,
+                nullable_field=None,
+            ),
+        ]
     )
     return db_mock
 
@@ -64,7 +68,7 @@ class TestComplexModelPartialSelection:
             assert isinstance(result.age, float)
             assert isinstance(result.is_active, bool)
             assert isinstance(result.score, (int, float))
-            assert not hasattr(result, "birthday")
+            assert result.model_fields_set == set(fields)
             assert not hasattr(result, "nullable_field")
 
     def test_select_with_type_conversion(
@@ -1,15 +1,30 @@
 """Test suite for the 'sqliter' library."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import pytest
 
 from sqliter import SqliterDB
+from sqliter.constants import STATEMENT_CACHE_SIZE
 from sqliter.exceptions import (
     RecordFetchError,
+    RecordInsertionError,
     RecordNotFoundError,
     TableCreationError,
 )
 from sqliter.model import BaseDBModel
-from tests.conftest import ComplexModel, DetailedPersonModel, ExampleModel
+from sqliter.model.model import _get_inflect_engine
+from tests.conftest import (
+    ComplexModel,
+    DetailedPersonModel,
+    ExampleModel,
+    PersonModel,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
 
 
 class ExistOkModel(BaseDBModel):
@@ -24,6 +39,19 @@ class ExistOkModel(BaseDBModel):
         table_name = "exist_ok_table"
 
 
+@pytest.fixture
+def no_inflect(mocker) -> Generator[None, None, None]:
+    """Simulate 'inflect' being unavailable for table name pluralization.
+
+    The shared 'inflect' engine is cached after the first lookup, so the cache
+    is cleared before and after the test to pick up the patched flag.
+    """
+    mocker.patch("sqliter.model.model._HAS_INFLECT", new=False)
+    _get_inflect_engine.cache_clear()
+    yield
+    _get_inflect_engine.cache_clear()
+
+
 class TestSqliterDB:
     """Test class to test the SqliterDB class."""
 
@@ -133,10 +161,8 @@ class TestSqliterDB:
         # Verify that get_table_name defaults to class name in lowercase
         assert DefaultNameModel.get_table_name() == "default_names"
 
-    def test_get_table_name_fallback_without_inflect(self, mocker) -> None:
+    def test_get_table_name_fallback_without_inflect(self, no_inflect) -> None:
         """Test get_table_name falls back to manual plural without 'inflect."""
-        # Mock the inflect import to raise ImportError for `inflect`
-        mocker.patch.dict("sys.modules", {"inflect": None})
 
         class UserModel(BaseDBModel):
             pass
@@ -144,10 +170,10 @@ class TestSqliterDB:
         table_name = UserModel.get_table_name()
         assert table_name == "users"  # Fallback logic should add 's'
 
-    def test_get_table_name_no_double_s_without_inflect(self, mocker) -> None:
+    def test_get_table_name_no_double_s_without_inflect(
+        self, no_inflect
+    ) -> None:
         """Test get_table_name doesn't add extra 's' if already there."""
-        # Mock the sys.modules to simulate 'inflect' being unavailable
-        mocker.patch.dict("sys.modules", {"inflect": None})
 
         class UsersModel(BaseDBModel):
             pass
@@ -182,6 +208,80 @@ class TestSqliterDB:
             assert result[4] == "MIT License"
             assert result[5] == "MIT License Content"
 
+    def test_insert_none_values_stored_as_null(self) -> None:
+        """Test that None values are bound and stored as NULL on insert."""
+        db = SqliterDB(memory=True)
+        db.create_table(PersonModel)
+
+        db.insert(PersonModel(name="Alice", age=None))
+        db.insert(PersonModel(name=None, age=30))
+
+        with db.connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT name, age FROM person_table ORDER BY pk")
+            first, second = cursor.fetchall()
+
+        assert first[0] == "Alice"
+        assert first[1] is None
+        assert second[0] is None
+
+    def test_bulk_insert(self, db_mock) -> None:
+        """Test inserting several records with a single bulk_insert call."""
+        count = db_mock.bulk_insert(
+            [
+                ExampleModel(slug="mit", name="MIT", content="MIT Content"),
+                ExampleModel(slug="gpl", name="GPL", content="GPL Content"),
+                ExampleModel(
+                    pk=10, slug="bsd", name="BSD", content="BSD Content"
+                ),
+            ]
+        )
+
+        assert count == 3
+        results = db_mock.select(ExampleModel).order("slug").fetch_all()
+        assert [result.slug for result in results] == ["bsd", "gpl", "mit"]
+        assert results[0].pk == 10
+        assert all(result.created_at > 0 for result in results)
+
+    def test_bulk_insert_preserves_order(self, db_mock) -> None:
+        """Test bulk_insert keeps the input order with mixed primary keys."""
+        db_mock.bulk_insert(
+            [
+                ExampleModel(slug="mit", name="MIT", content="MIT Content"),
+                ExampleModel(
+                    pk=10, slug="bsd", name="BSD", content="BSD Content"
+                ),
+                ExampleModel(slug="gpl", name="GPL", content="GPL Content"),
+            ]
+        )
+
+        results = db_mock.select(ExampleModel).order("pk").fetch_all()
+        assert [(result.pk, result.slug) for result in results] == [
+            (1, "mit"),
+            (10, "bsd"),
+            (11, "gpl"),
+        ]
+
+    def test_bulk_insert_empty(self, db_mock) -> None:
+        """Test that bulk_insert with no instances does nothing."""
+        assert db_mock.bulk_insert([]) == 0
+        assert db_mock.select(ExampleModel).count() == 0
+
+    def test_bulk_insert_mixed_models(self, db_mock) -> None:
+        """Test that bulk_insert rejects instances of different models."""
+        with pytest.raises(ValueError, match="same model class"):
+            db_mock.bulk_insert(
+                [
+                    ExampleModel(slug="mit", name="MIT", content="Content"),
+                    PersonModel(name="Alice", age=25),
+                ]
+            )
+
+    def test_bulk_insert_error(self, db_mock) -> None:
+        """Test that bulk_insert raises RecordInsertionError on failure."""
+        with pytest.raises(RecordInsertionError):
+            db_mock.bulk_insert([PersonModel(name="Alice", age=25)])
+
     def test_fetch_license(self, db_mock) -> None:
         """Test fetching a license by primary key."""
         test_model = ExampleModel(
@@ -294,6 +394,63 @@ class TestSqliterDB:
         exists = db_mock.select(ExampleModel).filter(slug="mit").exists()
         assert exists
 
+    def test_exists_no_matching_record(self, db_mock) -> None:
+        """Test that exists returns False when no record matches."""
+        db_mock.insert(
+            ExampleModel(
+                slug="mit", name="MIT License", content="MIT License Content"
+            )
+        )
+
+        assert not db_mock.select(ExampleModel).filter(slug="gpl").exists()
+
+    def test_exists_with_zero_limit(self, db_mock) -> None:
+        """Test that exists honours a zero limit, matching count."""
+        db_mock.insert(
+            ExampleModel(
+                slug="mit", name="MIT License", content="MIT License Content"
+            )
+        )
+
+        query = db_mock.select(ExampleModel).limit(0)
+
+        assert query.count() == 0
+        assert not query.exists()
+
+    @pytest.mark.parametrize(
+        ("limit", "offset", "expected"),
+        [
+            (None, 1, 1),
+            (None, 2, 0),
+            (1, 0, 1),
+            (5, 0, 2),
+            (1, 2, 0),
+        ],
+    )
+    def test_count_and_exists_with_limit_and_offset(
+        self, db_mock, limit, offset, expected
+    ) -> None:
+        """Test count and exists agree on the limit and offset window."""
+        db_mock.insert(
+            ExampleModel(
+                slug="mit", name="MIT License", content="MIT License Content"
+            )
+        )
+        db_mock.insert(
+            ExampleModel(
+                slug="gpl", name="GPL License", content="GPL License Content"
+            )
+        )
+
+        query = db_mock.select(ExampleModel).order("slug")
+        if limit is not None:
+            query = query.limit(limit)
+        query = query.offset(offset)
+
+        assert query.count() == expected
+        assert query.exists() is (expected > 0)
+        assert len(query.fetch_all()) == expected
+
     def test_transaction_commit(self, db_mock, mocker) -> None:
         """Test if auto_commit works correctly when enabled."""
         # Mock the commit method on the connection
@@ -505,7 +662,9 @@ class TestSqliterDB:
         db.connect()
 
         # Check if sqlite3.connect was called with the correct filename
-        mock_connect.assert_called_with(db_filename)
+        mock_connect.assert_called_with(
+            db_filename, cached_statements=STATEMENT_CACHE_SIZE
+        )
 
     def test_memory_database_no_file_created(self, mocker) -> None:
         """Test sqlite3.connect is called with ':memory:' when memory=True."""
@@ -516,7 +675,9 @@ class TestSqliterDB:
 
         # Check if sqlite3.connect was called with ':memory:' for the in-memory
         # DB
-        mock_connect.assert_called_with(":memory:")
+        mock_connect.assert_called_with(
+            ":memory:", cached_statements=STATEMENT_CACHE_SIZE
+        )
 
     def test_memory_db_ignores_filename(self, mocker) -> None:
         """Test memory=True igores any filename, creating an in-memory DB."""
@@ -528,7 +689,9 @@ class TestSqliterDB:
 
         # Check that sqlite3.connect was called with ':memory:', ignoring the
         # filename
-        mock_connect.assert_called_with(":memory:")
+        mock_connect.assert_called_with(
+            ":memory:", cached_statements=STATEMENT_CACHE_SIZE
+        )
 
     def test_complex_model_field_types(self, db_mock) -> None:
         """Test that the table is created with the correct field types."""